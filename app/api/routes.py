@@ -9,6 +9,7 @@ from app.models.schemas import (
     BatchIrisResponse,
     BatchDiabetesResponse,
     HealthResponse,
+    DriftResponse,
 )
 from app.ml.model import model_registry, ModelOptions
 
@@ -127,6 +128,22 @@ async def get_model_info(model_option: ModelOptions):
         )
 
 
+@router.get("/{model_option}/drift", response_model=DriftResponse)
+async def get_drift(model_option: ModelOptions):
+    """Compare served inputs and outputs against training reference statistics"""
+    try:
+        ml_model = model_registry.get_model(model_option)
+    except ValueError:
+        raise HTTPException(
+            status_code=404, detail=f"Model {model_option.value} not found"
+        )
+
+    try:
+        return DriftResponse(**ml_model.get_drift_report())
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
 @router.get("/")
 async def list_models():
     """List all available models"""
@@ -138,12 +155,14 @@ async def list_models():
                 "batch_predict": "/iris/predict/batch",
                 "health": "/iris/health",
                 "info": "/iris/info",
+                "drift": "/iris/drift",
             },
             "diabetes": {
                 "predict": "/diabetes/predict",
                 "batch_predict": "/diabetes/predict/batch",
                 "health": "/diabetes/health",
                 "info": "/diabetes/info",
+                "drift": "/diabetes/drift",
             },
         },
     }
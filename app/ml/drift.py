@@ -0,0 +1,183 @@
+import numpy as np
+from typing import Dict, List, Optional
+
+# Small constant so empty histogram bins don't blow up the PSI log term
+PSI_EPSILON = 1e-4
+
+
+class StreamingStats:
+    """Per-feature streaming summary: running mean/variance, min/max and a
+    fixed-bin histogram with one underflow and one overflow bin.
+
+    Each update is a handful of vectorized numpy operations over the whole
+    batch, so callers should buffer served rows and fold them together
+    rather than updating once per row.
+    """
+
+    def __init__(
+        self, names: List[str], lower: np.ndarray, upper: np.ndarray, n_bins: int
+    ):
+        self.names = list(names)
+        self.n_bins = n_bins
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+
+        # Constant features get a zero inverse width, so every in-range
+        # value lands in the first real bin
+        width = (self.upper - self.lower) / n_bins
+        self._inv_width = np.divide(
+            1.0, width, out=np.zeros_like(width), where=width > 0
+        )
+        n_features = len(self.names)
+        # Offset each feature into its own slice so one bincount covers all,
+        # shifted by one so bin -1 (underflow) maps to the slice's first slot
+        self._offsets = np.arange(n_features) * (n_bins + 2) + 1
+        self.reset()
+
+    @classmethod
+    def from_reference(cls, reference: dict) -> "StreamingStats":
+        """Build live stats binned the same way as the reference statistics"""
+        return cls(
+            reference["names"],
+            reference["min"],
+            reference["max"],
+            reference["n_bins"],
+        )
+
+    def reset(self):
+        n_features = len(self.names)
+        self.count = 0
+        self.non_finite = 0
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+        self.min = np.full(n_features, np.inf)
+        self.max = np.full(n_features, -np.inf)
+        self.histogram = np.zeros((n_features, self.n_bins + 2), dtype=np.int64)
+
+    def update(self, X: np.ndarray):
+        """Fold a (n_samples, n_features) batch into the running summary"""
+        # Work feature-major: per-feature reductions then run over contiguous
+        # memory, which is several times faster than reducing along axis 0
+        T = np.ascontiguousarray(np.asarray(X, dtype=float).T)
+        batch_sum = T.sum(axis=1)
+
+        # NaN/inf rows can't be binned or averaged; count them and move on.
+        # The per-feature sums are only non-finite if some row is, so the
+        # per-row mask is skipped on clean batches.
+        if not np.isfinite(batch_sum).all():
+            finite = np.isfinite(T).all(axis=0)
+            self.non_finite += int((~finite).sum())
+            T = np.ascontiguousarray(T[:, finite])
+            batch_sum = T.sum(axis=1)
+
+        n_batch = T.shape[1]
+        if n_batch == 0:
+            return
+
+        lower = self.lower[:, None]
+        upper = self.upper[:, None]
+
+        # Bin 0 is underflow, bin n_bins + 1 is overflow
+        bins = T - lower
+        bins *= self._inv_width[:, None]
+        np.floor(bins, out=bins)
+        np.clip(bins, 0, self.n_bins - 1, out=bins)
+        bins -= T < lower
+        bins += T > upper
+        flat = bins.astype(np.intp)
+        flat += self._offsets[:, None]
+        counts = np.bincount(flat.ravel(), minlength=self.histogram.size)
+
+        # Running mean/variance, merged with Chan et al.'s parallel update
+        batch_mean = batch_sum / n_batch
+        centered = T - batch_mean[:, None]
+        batch_m2 = np.einsum("ij,ij->i", centered, centered)
+        total = self.count + n_batch
+        delta = batch_mean - self.mean
+        self.mean += delta * (n_batch / total)
+        self.m2 += batch_m2 + delta**2 * (self.count * n_batch / total)
+        self.count = total
+
+        np.minimum(self.min, T.min(axis=1), out=self.min)
+        np.maximum(self.max, T.max(axis=1), out=self.max)
+        self.histogram += counts.reshape(self.histogram.shape)
+
+    @property
+    def std(self) -> np.ndarray:
+        if self.count == 0:
+            return np.zeros_like(self.m2)
+        return np.sqrt(self.m2 / self.count)
+
+    def to_reference(self) -> dict:
+        """Export the summary in the format saved alongside trained models"""
+        return {
+            "names": self.names,
+            "n_bins": self.n_bins,
+            "count": self.count,
+            "mean": self.mean.copy(),
+            "std": self.std,
+            "min": self.lower,
+            "max": self.upper,
+            "histogram": self.histogram.copy(),
+        }
+
+    def compare(self, reference: dict) -> List[Dict[str, Optional[float]]]:
+        """Compare the live summary against reference statistics per feature"""
+        ref_mean = np.asarray(reference["mean"], dtype=float)
+        ref_std = np.asarray(reference["std"], dtype=float)
+        ref_hist = np.asarray(reference["histogram"], dtype=float)
+
+        std = self.std
+        mean_shift = np.divide(
+            self.mean - ref_mean,
+            ref_std,
+            out=np.zeros_like(ref_mean),
+            where=ref_std > 0,
+        )
+        # A shift away from a constant reference has no finite size
+        undefined_shift = (ref_std == 0) & ~np.isclose(self.mean, ref_mean)
+
+        # Population stability index over the shared histogram bins
+        live = self.histogram + PSI_EPSILON
+        live /= live.sum(axis=1, keepdims=True)
+        ref = ref_hist + PSI_EPSILON
+        ref /= ref.sum(axis=1, keepdims=True)
+        psi = ((live - ref) * np.log(live / ref)).sum(axis=1)
+
+        has_data = self.count > 0
+        results = []
+        for i, name in enumerate(self.names):
+            results.append(
+                {
+                    "name": name,
+                    "count": self.count,
+                    "mean": float(self.mean[i]) if has_data else None,
+                    "std": float(std[i]) if has_data else None,
+                    "min": float(self.min[i]) if has_data else None,
+                    "max": float(self.max[i]) if has_data else None,
+                    "reference_mean": float(ref_mean[i]),
+                    "reference_std": float(ref_std[i]),
+                    "mean_shift": (
+                        float(mean_shift[i])
+                        if has_data and not undefined_shift[i]
+                        else None
+                    ),
+                    "psi": float(psi[i]) if has_data else None,
+                    "histogram": self.histogram[i].tolist(),
+                    "reference_histogram": ref_hist[i].astype(int).tolist(),
+                }
+            )
+        return results
+
+
+def compute_reference_stats(
+    X: np.ndarray, names: List[str], n_bins: int = 10
+) -> dict:
+    """Summarise training data for drift comparison against served traffic.
+
+    Uses the same binning as the live stats so the histograms always line up.
+    """
+    X = np.asarray(X, dtype=float)
+    stats = StreamingStats(names, X.min(axis=0), X.max(axis=0), n_bins)
+    stats.update(X)
+    return stats.to_reference()
@@ -4,6 +4,11 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 import os
 
+from app.ml.drift import StreamingStats
+
+# Served rows buffered before the drift stats are folded in one numpy pass
+DRIFT_FLUSH_ROWS = 1024
+
 
 class ModelOptions(str, Enum):
     iris = "iris"
@@ -17,6 +22,11 @@ class MLModel:
         self.model = None
         self.metadata = None
         self.is_loaded = False
+        self.input_stats: Optional[StreamingStats] = None
+        self.output_stats: Optional[StreamingStats] = None
+        self._drift_inputs: Optional[np.ndarray] = None
+        self._drift_outputs: Optional[np.ndarray] = None
+        self._drift_rows = 0
 
     def load_model(self):
         """Load the trained model and metadata"""
@@ -31,6 +41,7 @@ class MLModel:
             self.model = joblib.load(model_path)
             self.metadata = joblib.load(metadata_path)
             self.model_type = self.metadata["model_type"]
+            self._init_drift()
             self.is_loaded = True
             print("Model loaded successfully!")
 
@@ -38,6 +49,23 @@ class MLModel:
             print(f"Error loading model: {e}")
             self.is_loaded = False
 
+    def _init_drift(self):
+        """Set up drift stats and row buffers from the metadata reference stats"""
+        self.input_stats = self.output_stats = None
+        self._drift_inputs = self._drift_outputs = None
+        self._drift_rows = 0
+
+        # Models trained before reference stats existed skip drift tracking
+        reference = self.metadata.get("reference_stats")
+        if reference is None:
+            return
+        self.input_stats = StreamingStats.from_reference(reference["inputs"])
+        self.output_stats = StreamingStats.from_reference(reference["outputs"])
+        self._drift_inputs = np.empty((DRIFT_FLUSH_ROWS, len(self.input_stats.names)))
+        self._drift_outputs = np.empty(
+            (DRIFT_FLUSH_ROWS, len(self.output_stats.names))
+        )
+
     def predict(
         self, features: List[float]
     ) -> Tuple[str, Optional[int], Optional[float]]:
@@ -46,13 +74,14 @@ class MLModel:
             raise ValueError("Model not loaded")
 
         # Convert to numpy array and reshape for single prediction
-        X = np.array(features).reshape(1, -1)
+        X = self._input_row(features)
 
         if self.model_type == "classification":
             # Get prediction and probability
             prediction_id = self.model.predict(X)[0]
             probabilities = self.model.predict_proba(X)[0]
             confidence = float(max(probabilities))
+            self._record_row(probabilities)
 
             # Get species name
             prediction_name = self.metadata["target_names"][prediction_id]
@@ -60,6 +89,7 @@ class MLModel:
             return prediction_name, int(prediction_id), confidence
         elif self.model_type == "regression":
             prediction = self.model.predict(X)[0]
+            self._record_row(prediction)
             ## todo: justify a confidence measurement and implement
 
             return prediction, None, None
@@ -74,12 +104,13 @@ class MLModel:
             raise ValueError("Model not loaded")
 
         # Convert to numpy array
-        X = np.array(samples)
+        X = self._input_rows(samples)
 
         if self.model_type == "classification":
             # Get predictions and probabilities
             predictions = self.model.predict(X)
             probabilities = self.model.predict_proba(X)
+            self._record_rows(X, probabilities)
 
             results = []
             for i, (pred_id, probs) in enumerate(zip(predictions, probabilities)):
@@ -89,10 +120,116 @@ class MLModel:
             return results
         elif self.model_type == "regression":
             predictions = self.model.predict(X)
+            self._record_rows(X, predictions.reshape(-1, 1))
             return [(p, None, None) for p in predictions]
         else:
             raise ValueError("Invalid model type")
 
+    def _input_row(self, features: List[float]) -> np.ndarray:
+        """Build the (1, n_features) model input for a single prediction.
+
+        When drift is tracked the input is written straight into the next
+        free row of the drift buffer, so recording it costs no extra copy.
+        The row only counts once `_record_row` stores the matching output.
+        """
+        if self._drift_inputs is None:
+            return np.array(features).reshape(1, -1)
+        i = self._drift_rows
+        X = self._drift_inputs[i : i + 1]
+        try:
+            X[0] = features
+        except ValueError:
+            # Wrong feature count; let the model report it as before
+            return np.array(features).reshape(1, -1)
+        return X
+
+    def _record_row(self, output):
+        """Commit the row started by `_input_row` with its model output"""
+        if self._drift_outputs is None:
+            return
+        i = self._drift_rows
+        # Drift monitoring must never fail the prediction it observes
+        try:
+            self._drift_outputs[i] = output
+        except ValueError as e:
+            print(f"Error recording drift statistics, row dropped: {e}")
+            return
+        self._drift_rows = i + 1
+        if self._drift_rows == DRIFT_FLUSH_ROWS:
+            self._flush_drift()
+
+    def _input_rows(self, samples: List[List[float]]) -> np.ndarray:
+        """Build the (n_samples, n_features) model input for a batch.
+
+        Like `_input_row`, batches that fit are written straight into the
+        drift buffer. Batches larger than the buffer are folded directly by
+        `_record_rows` instead.
+        """
+        n = len(samples)
+        if self._drift_inputs is None or n > DRIFT_FLUSH_ROWS:
+            return np.array(samples)
+        if self._drift_rows + n > DRIFT_FLUSH_ROWS:
+            self._flush_drift()
+        i = self._drift_rows
+        X = self._drift_inputs[i : i + n]
+        try:
+            X[...] = samples
+        except ValueError:
+            return np.array(samples)
+        return X
+
+    def _record_rows(self, X: np.ndarray, outputs: np.ndarray):
+        """Commit the rows started by `_input_rows` with their model outputs"""
+        if self._drift_outputs is None:
+            return
+        n = len(X)
+        # Drift monitoring must never fail the prediction it observes
+        try:
+            if n > DRIFT_FLUSH_ROWS:
+                self.input_stats.update(X)
+                self.output_stats.update(outputs)
+                return
+            i = self._drift_rows
+            self._drift_outputs[i : i + n] = outputs
+        except ValueError as e:
+            print(f"Error recording drift statistics, {n} rows dropped: {e}")
+            return
+        self._drift_rows = i + n
+        if self._drift_rows == DRIFT_FLUSH_ROWS:
+            self._flush_drift()
+
+    def _flush_drift(self):
+        """Fold the buffered rows into the drift stats"""
+        n_rows = self._drift_rows
+        if n_rows == 0:
+            return
+        self._drift_rows = 0
+
+        # update copies what it needs, so the buffers can be reused right away
+        try:
+            self.input_stats.update(self._drift_inputs[:n_rows])
+            self.output_stats.update(self._drift_outputs[:n_rows])
+        except Exception as e:
+            print(f"Error recording drift statistics, {n_rows} rows dropped: {e}")
+
+    def get_drift_report(self) -> dict:
+        """Compare served traffic against the training reference statistics"""
+        if not self.is_loaded:
+            raise ValueError("Model not loaded")
+        if self.input_stats is None:
+            raise ValueError("Reference statistics not available")
+
+        reference = self.metadata["reference_stats"]
+        self._flush_drift()
+        return {
+            "dataset": self.dataset_name,
+            "samples_seen": self.input_stats.count,
+            "non_finite_samples": self.input_stats.non_finite,
+            "reference_samples": reference["inputs"]["count"],
+            "features": self.input_stats.compare(reference["inputs"]),
+            "outputs": self.output_stats.compare(reference["outputs"]),
+        }
+
     def get_model_info(self) -> dict:
         """Get model metadata"""
         if not self.is_loaded:
@@ -107,3 +107,39 @@ class HealthResponse(BaseModel):
     model_loaded: bool = Field(..., description="Whether the model is loaded")
     feature_count: int = Field(..., description="Number of features expected")
     model_type: str = Field(..., description="Type and name of the model")
+
+
+class FeatureDrift(BaseModel):
+    name: str = Field(..., description="Feature or model output name")
+    count: int = Field(..., description="Number of served samples summarised")
+    mean: Optional[float] = Field(None, description="Running mean of served values")
+    std: Optional[float] = Field(None, description="Running std of served values")
+    min: Optional[float] = Field(None, description="Smallest served value")
+    max: Optional[float] = Field(None, description="Largest served value")
+    reference_mean: float = Field(..., description="Mean over the training data")
+    reference_std: float = Field(..., description="Std over the training data")
+    mean_shift: Optional[float] = Field(
+        None,
+        description="Served mean minus reference mean, in reference stds; "
+        "null if the reference is constant and the served mean differs",
+    )
+    psi: Optional[float] = Field(
+        None, description="Population stability index against the training data"
+    )
+    histogram: List[int] = Field(
+        ..., description="Served counts per bin, with underflow and overflow bins"
+    )
+    reference_histogram: List[int] = Field(
+        ..., description="Training counts per bin, with underflow and overflow bins"
+    )
+
+
+class DriftResponse(BaseModel):
+    dataset: str = Field(..., description="Dataset the model was trained on")
+    samples_seen: int = Field(..., description="Number of served samples")
+    non_finite_samples: int = Field(
+        ..., description="Served samples skipped for containing NaN or inf"
+    )
+    reference_samples: int = Field(..., description="Number of training samples")
+    features: List[FeatureDrift]
+    outputs: List[FeatureDrift]
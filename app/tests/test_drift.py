@@ -0,0 +1,237 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+from app.main import app
+from app.ml.drift import StreamingStats, compute_reference_stats
+from app.ml.model import DRIFT_FLUSH_ROWS, MLModel, model_registry, ModelOptions
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(500, 3))
+
+
+def make_stats(X):
+    return StreamingStats(
+        ["a", "b", "c"][: X.shape[1]], X.min(axis=0), X.max(axis=0), 10
+    )
+
+
+def make_model(data):
+    model = MLModel("test")
+    model.is_loaded = True
+    model.metadata = {
+        "reference_stats": {
+            "inputs": compute_reference_stats(data, ["a", "b", "c"]),
+            "outputs": compute_reference_stats(data[:, :1], ["a"]),
+        }
+    }
+    model._init_drift()
+    return model
+
+
+@pytest.fixture
+def iris_model(monkeypatch):
+    """Swap a small trained iris forest into the global registry"""
+    iris = load_iris()
+    model = RandomForestClassifier(n_estimators=10, random_state=0)
+    model.fit(iris.data, iris.target)
+    metadata = {
+        "model_type": "classification",
+        "feature_names": iris.feature_names,
+        "target_names": iris.target_names.tolist(),
+        "n_features": len(iris.feature_names),
+        "reference_stats": {
+            "inputs": compute_reference_stats(iris.data, iris.feature_names),
+            "outputs": compute_reference_stats(
+                model.predict_proba(iris.data), iris.target_names
+            ),
+        },
+    }
+
+    ml_model = model_registry.get_model(ModelOptions.iris)
+    for name in (
+        "model",
+        "metadata",
+        "model_type",
+        "is_loaded",
+        "input_stats",
+        "output_stats",
+        "_drift_inputs",
+        "_drift_outputs",
+        "_drift_rows",
+    ):
+        monkeypatch.setattr(ml_model, name, getattr(ml_model, name))
+    ml_model.model = model
+    ml_model.metadata = metadata
+    ml_model.model_type = "classification"
+    ml_model.is_loaded = True
+    ml_model._init_drift()
+    return ml_model
+
+
+def test_chunked_updates_match_full_batch(data):
+    full = make_stats(data)
+    full.update(data)
+
+    chunked = make_stats(data)
+    for start in range(0, len(data), 7):
+        chunked.update(data[start : start + 7])
+
+    assert chunked.count == len(data)
+    np.testing.assert_allclose(chunked.mean, data.mean(axis=0))
+    np.testing.assert_allclose(chunked.std, data.std(axis=0))
+    np.testing.assert_array_equal(chunked.min, data.min(axis=0))
+    np.testing.assert_array_equal(chunked.max, data.max(axis=0))
+    np.testing.assert_array_equal(chunked.histogram, full.histogram)
+
+    for i in range(data.shape[1]):
+        column = data[:, i]
+        expected, _ = np.histogram(
+            column, bins=10, range=(column.min(), column.max())
+        )
+        np.testing.assert_array_equal(full.histogram[i, 1:-1], expected)
+
+
+def test_out_of_range_values_use_underflow_and_overflow_bins():
+    stats = StreamingStats(["x"], [0.0], [1.0], 4)
+    stats.update(np.array([[-0.5], [0.0], [0.5], [1.0], [1.5], [2.0]]))
+
+    assert stats.histogram[0].tolist() == [1, 1, 0, 1, 1, 2]
+
+
+def test_compare_without_data_returns_none_fields(data):
+    reference = compute_reference_stats(data, ["a", "b", "c"])
+    stats = StreamingStats.from_reference(reference)
+
+    for feature in stats.compare(reference):
+        assert feature["count"] == 0
+        for key in ("mean", "std", "min", "max", "mean_shift", "psi"):
+            assert feature[key] is None
+
+
+def test_non_finite_rows_are_skipped(data):
+    stats = make_stats(data)
+    batch = data[:4].copy()
+    batch[1, 0] = np.nan
+    batch[2, 2] = np.inf
+    stats.update(batch)
+
+    assert stats.count == 2
+    assert stats.non_finite == 2
+    assert np.isfinite(stats.mean).all()
+    np.testing.assert_allclose(stats.mean, batch[[0, 3]].mean(axis=0))
+    assert stats.histogram.sum() == 2 * data.shape[1]
+
+
+def test_constant_feature_matches_reference():
+    X = np.ones((5, 1))
+    reference = compute_reference_stats(X, ["x"])
+    stats = StreamingStats.from_reference(reference)
+    stats.update(X)
+
+    np.testing.assert_array_equal(stats.histogram[0], reference["histogram"][0])
+    (feature,) = stats.compare(reference)
+    assert feature["psi"] == pytest.approx(0.0)
+
+
+def test_mean_shift_from_constant_reference():
+    reference = compute_reference_stats(np.ones((5, 2)), ["x", "y"])
+    stats = StreamingStats.from_reference(reference)
+    stats.update(np.array([[1.0, 3.0], [1.0, 5.0]]))
+
+    x, y = stats.compare(reference)
+    assert x["mean_shift"] == 0.0
+    assert y["mean_shift"] is None
+
+
+def test_buffered_rows_are_flushed_for_report(data):
+    model = make_model(data)
+    for i in range(10):
+        X = model._input_row(data[i].tolist())
+        model._record_row(data[i, 0])
+    model._record_rows(model._input_rows(data[10:20].tolist()), data[10:20, :1])
+
+    report = model.get_drift_report()
+
+    assert report["samples_seen"] == 20
+    assert report["features"][0]["mean"] == pytest.approx(data[:20, 0].mean())
+    np.testing.assert_array_equal(X, data[9:10])
+
+
+def test_batches_of_any_size_are_all_folded(data):
+    data = np.tile(data, (5, 1))
+    model = make_model(data)
+    # Fits the buffer, then forces a flush, then exceeds the buffer
+    for batch in (data[:1000], data[1000:1100], data[1100:]):
+        X = model._input_rows(batch.tolist())
+        np.testing.assert_array_equal(X, batch)
+        model._record_rows(X, batch[:, :1])
+
+    assert model.input_stats.count == 1000 + len(data[1100:])
+    model._flush_drift()
+    assert model.input_stats.count == len(data)
+    np.testing.assert_allclose(model.input_stats.mean, data.mean(axis=0))
+    np.testing.assert_allclose(model.output_stats.mean, data[:, :1].mean(axis=0))
+
+
+def test_recording_never_fails_prediction(data):
+    model = make_model(data)
+    # Wrong widths can't be buffered; the rows are dropped, nothing raises
+    model._input_row([1.0, 2.0])
+    model._record_row(np.ones(2))
+    model._record_rows(model._input_rows([[1.0, 2.0]] * 3), np.ones((3, 2)))
+    model._flush_drift()
+
+    assert model.input_stats.count == 0
+
+
+def test_drift_route_reports_served_traffic(iris_model):
+    client = TestClient(app)
+    for features in (
+        [5.1, 3.5, 1.4, 0.2],
+        [6.2, 2.9, 4.3, 1.3],
+        [7.3, 2.9, 6.3, 1.8],
+    ):
+        response = client.post("/api/v1/iris/predict", json={"features": features})
+        assert response.status_code == 200
+    response = client.post(
+        "/api/v1/iris/predict/batch",
+        json={"samples": [[5.0, 3.4, 1.5, 0.2], [9.9, 2.9, 6.3, 1.8]]},
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/iris/drift")
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["samples_seen"] == 5
+    assert report["reference_samples"] == 150
+    assert [f["name"] for f in report["features"]] == load_iris().feature_names
+    assert [f["name"] for f in report["outputs"]] == [
+        "setosa",
+        "versicolor",
+        "virginica",
+    ]
+    for feature in report["features"] + report["outputs"]:
+        assert len(feature["histogram"]) == 12
+        assert sum(feature["histogram"]) == 5
+    # 9.9 cm sepal length is beyond the training range
+    assert report["features"][0]["histogram"][-1] == 1
+
+
+def test_drift_route_without_reference_stats(monkeypatch):
+    ml_model = model_registry.get_model(ModelOptions.iris)
+    monkeypatch.setattr(ml_model, "is_loaded", True)
+    monkeypatch.setattr(ml_model, "metadata", {"model_type": "classification"})
+    monkeypatch.setattr(ml_model, "input_stats", None)
+    monkeypatch.setattr(ml_model, "output_stats", None)
+
+    response = TestClient(app).get("/api/v1/iris/drift")
+
+    assert response.status_code == 503
+    assert response.json()["detail"] == "Reference statistics not available"
@@ -0,0 +1,115 @@
+"""
+Benchmark for the streaming drift statistics
+Reports the per-row overhead drift tracking adds to MLModel.predict and
+MLModel.predict_batch, measured against stub estimators so only the serving
+code around the model is timed
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.ml.drift import compute_reference_stats
+from app.ml.model import MLModel
+
+N_FEATURES = 10
+N_CLASSES = 3
+N_ROWS = 100_000
+REPEATS = 8
+
+
+class StubClassifier:
+    """Constant classifier, so timings exclude any real model work"""
+
+    def predict(self, X):
+        return np.zeros(len(X), dtype=int)
+
+    def predict_proba(self, X):
+        return np.full((len(X), N_CLASSES), 1.0 / N_CLASSES)
+
+
+class StubRegressor:
+    def predict(self, X):
+        return np.zeros(len(X))
+
+
+def make_model(model_type: str, track_drift: bool) -> MLModel:
+    """Build a loaded MLModel around a stub estimator"""
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-1, 1, (1000, N_FEATURES))
+    if model_type == "classification":
+        estimator = StubClassifier()
+        target_names = [f"class_{i}" for i in range(N_CLASSES)]
+        output_names = target_names
+    else:
+        estimator = StubRegressor()
+        target_names = "target"
+        output_names = ["target"]
+    outputs = rng.uniform(0, 1, (1000, len(output_names)))
+
+    model = MLModel("benchmark")
+    model.model = estimator
+    model.model_type = model_type
+    model.metadata = {
+        "model_type": model_type,
+        "target_names": target_names,
+    }
+    if track_drift:
+        model.metadata["reference_stats"] = {
+            "inputs": compute_reference_stats(
+                X, [f"x{i}" for i in range(N_FEATURES)]
+            ),
+            "outputs": compute_reference_stats(outputs, output_names),
+        }
+    model._init_drift()
+    model.is_loaded = True
+    return model
+
+
+def prediction_timer(model: MLModel, batch_size: int):
+    """Return a callable that serves N_ROWS rows through the model"""
+    rng = np.random.default_rng(0)
+    # Pydantic hands the routes plain lists of floats
+    samples = rng.uniform(-1, 1, (batch_size, N_FEATURES)).tolist()
+    n_calls = N_ROWS // batch_size
+    if batch_size == 1:
+        call = lambda: model.predict(samples[0])  # noqa: E731
+    else:
+        call = lambda: model.predict_batch(samples)  # noqa: E731
+
+    def run():
+        # Include the final flush so buffered work is accounted for
+        for _ in range(n_calls):
+            call()
+        model._flush_drift()
+
+    return run
+
+
+def overhead_per_row(model_type: str, batch_size: int) -> float:
+    """Return the extra µs per row drift tracking adds to predictions"""
+    with_drift = prediction_timer(make_model(model_type, True), batch_size)
+    without = prediction_timer(make_model(model_type, False), batch_size)
+    # Interleave the runs, alternating which goes first, so both see the
+    # same machine conditions
+    timings = {with_drift: float("inf"), without: float("inf")}
+    for repeat in range(REPEATS):
+        order = (with_drift, without) if repeat % 2 else (without, with_drift)
+        for run in order:
+            timings[run] = min(timings[run], timeit.timeit(run, number=1))
+    best_with, best_without = timings[with_drift], timings[without]
+    n_rows = (N_ROWS // batch_size) * batch_size
+    return (best_with - best_without) / n_rows * 1e6
+
+
+if __name__ == "__main__":
+    print(f"Drift tracking overhead ({N_FEATURES} features, {N_ROWS} rows)")
+    for model_type in ("classification", "regression"):
+        print(f"  {model_type}")
+        for batch_size in (1, 2, 10, 100, 1000):
+            overhead = overhead_per_row(model_type, batch_size)
+            print(f"    batch size {batch_size:>5}: {overhead:.3f} µs/row")
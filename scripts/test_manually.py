@@ -118,6 +118,22 @@ def test_model_info():
         print()
 
 
+def test_drift_endpoints():
+    """Test drift endpoints for both models"""
+    print("📈 Testing drift endpoints...")
+
+    models = ["iris", "diabetes"]
+    for model in models:
+        print(f"  Testing {model} drift...")
+        response = requests.get(f"{BASE_URL}/{model}/drift")
+        print(f"  Status: {response.status_code}")
+        if response.status_code == 200:
+            print(f"  Response: {json.dumps(response.json(), indent=2)}")
+        else:
+            print(f"  Error: {response.text}")
+        print()
+
+
 def test_error_cases():
     """Test error handling"""
     print("❌ Testing error cases...")
@@ -157,6 +173,7 @@ if __name__ == "__main__":
         test_iris_batch_prediction()
         test_diabetes_batch_prediction()
         test_model_info()
+        test_drift_endpoints()
         test_error_cases()
         print("✅ All tests completed!")
 
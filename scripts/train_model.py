@@ -6,6 +6,11 @@ from sklearn.linear_model import Ridge
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, mean_squared_error, r2_score
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.ml.drift import compute_reference_stats
 
 
 def train_iris_model():
@@ -37,6 +42,12 @@ def train_iris_model():
         "feature_names": iris.feature_names,
         "target_names": iris.target_names.tolist(),
         "n_features": len(iris.feature_names),
+        "reference_stats": {
+            "inputs": compute_reference_stats(X_train, iris.feature_names),
+            "outputs": compute_reference_stats(
+                model.predict_proba(X_train), iris.target_names
+            ),
+        },
     }
     joblib.dump(model_metadata, "../app/ml/saved_models/iris_metadata.pkl")
 
@@ -74,6 +85,12 @@ def train_diabetes_model():
         "feature_names": diabetes.feature_names,
         "target_names": "disease_progression",
         "n_features": len(diabetes.feature_names),
+        "reference_stats": {
+            "inputs": compute_reference_stats(X_train, diabetes.feature_names),
+            "outputs": compute_reference_stats(
+                model.predict(X_train).reshape(-1, 1), ["disease_progression"]
+            ),
+        },
     }
     joblib.dump(model_metadata, "../app/ml/saved_models/diabetes_metadata.pkl")
 